@@ -0,0 +1,187 @@
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import pandas as pd
+import streamlit as st
+
+URL = "https://r.jina.ai/https://www.farside.co.uk/bitcoin-etf-flows"
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+CACHE_TTL = 600
+CACHE_PATH = Path(".cache/flows.parquet")
+CACHE_META_PATH = Path(".cache/flows.json")
+# Arrow-backed strings: one contiguous buffer per column instead of a Python
+# object per cell
+FLOWS_DTYPE = "string[pyarrow]"
+
+# r.jina.ai returns Markdown, so the flows table arrives as "| a | b |" rows:
+# a header row with a "Date" cell plus the block of rows directly below it
+FLOWS_TABLE_RE = re.compile(
+    r"^\|(?:[^\n]*\|)?[ \t]*Date[ \t]*\|(?:[^\n]*\|)?[ \t]*\n"
+    r"(?:\|[^\n]*\|[ \t]*(?:\n|$))*",
+    re.M,
+)
+TABLE_ROW_RE = re.compile(r"^\|(.*)\|[ \t]*$", re.M)
+SEPARATOR_CELL_RE = re.compile(r"^:?-+:?$")
+# Cell boundaries are the pipes that are not escaped as "\|"
+CELL_SEP_RE = re.compile(r"(?<!\\)\|")
+
+
+# One pooled Session per server process, shared by every script rerun and
+# by both dashboard entry points.
+@st.cache_resource
+def get_session():
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    # Ignore Retry-After: a long one would stall the locked fetch, and with it
+    # every session, for as long as the server asks
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        respect_retry_after_header=False,
+    )
+    session.mount(
+        "https://",
+        HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry),
+    )
+    return session
+
+
+# Validators and frame from the last successful fetch, so an expired TTL can
+# revalidate with a conditional GET instead of re-downloading and re-parsing.
+# Seeded from the disk cache so revalidation also works after a cold start.
+@st.cache_resource
+def get_last_fetch():
+    last = {"etag": None, "last_modified": None, "digest": None, "df": None}
+    try:
+        last.update(json.loads(CACHE_META_PATH.read_text()))
+        last["df"] = read_parquet_flows()
+    except (OSError, ValueError):
+        pass
+    return last
+
+
+def read_parquet_flows():
+    # Parquet only records "string"; resolve that to Arrow storage while
+    # reading so the columns never pass through one Python str per cell
+    with pd.option_context("mode.string_storage", "pyarrow"):
+        return pd.read_parquet(CACHE_PATH)
+
+
+def read_disk_cache():
+    try:
+        if time.time() - CACHE_PATH.stat().st_mtime < CACHE_TTL:
+            return read_parquet_flows()
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def write_disk_cache(last):
+    # Best effort: a read-only or full disk only costs us the cold-start cache
+    try:
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        last["df"].to_parquet(CACHE_PATH, compression="zstd")
+        meta = {key: last[key] for key in ("etag", "last_modified", "digest")}
+        CACHE_META_PATH.write_text(json.dumps(meta))
+    except (OSError, ValueError):
+        pass
+
+
+def touch_disk_cache(last):
+    # Restart the disk cache's TTL without re-encoding an unchanged frame;
+    # rewrite it only if it is gone (e.g. after a forced refresh)
+    try:
+        os.utime(CACHE_PATH)
+    except FileNotFoundError:
+        write_disk_cache(last)
+    except OSError:
+        pass
+
+
+def split_table_row(row):
+    return [cell.strip().replace("\\|", "|") for cell in CELL_SEP_RE.split(row)]
+
+
+def parse_markdown_table(text):
+    # One regex scan locates the table; it ends at the first line that is not
+    # a table row, so rows from any later table on the page are never picked up
+    for match in FLOWS_TABLE_RE.finditer(text):
+        header, *rows = map(split_table_row, TABLE_ROW_RE.findall(match.group()))
+        if "Date" in header:
+            break
+    else:
+        return None
+
+    body = [
+        row
+        for row in rows
+        if len(row) == len(header) and not all(SEPARATOR_CELL_RE.match(cell) for cell in row)
+    ]
+
+    # A header with no rows is a truncated response, not an empty history;
+    # returning None keeps it from replacing the last good frame
+    if not body:
+        return None
+    return pd.DataFrame(body, columns=header, dtype=FLOWS_DTYPE)
+
+
+@st.cache_resource(ttl=CACHE_TTL)
+def fetch_farside_flows():
+    try:
+        df = read_disk_cache()
+        if df is not None:
+            return df
+
+        last = get_last_fetch()
+        headers = {}
+        if last["df"] is not None:
+            if last["etag"]:
+                headers["If-None-Match"] = last["etag"]
+            if last["last_modified"]:
+                headers["If-Modified-Since"] = last["last_modified"]
+
+        resp = get_session().get(URL, headers=headers, timeout=10)
+        if resp.status_code == 304:
+            touch_disk_cache(last)
+            return last["df"]
+        resp.raise_for_status()
+        # Skip charset detection over the whole body; Jina serves UTF-8
+        resp.encoding = "utf-8"
+
+        # The proxy may not forward validators, so also skip the parse when the
+        # body is byte-for-byte what we parsed last time
+        digest = hashlib.sha256(resp.content).hexdigest()
+        if digest == last["digest"] and last["df"] is not None:
+            df = last["df"]
+        else:
+            df = parse_markdown_table(resp.text)
+
+        if df is not None:
+            meta = {
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "digest": digest,
+            }
+            if df is last["df"] and all(last[key] == value for key, value in meta.items()):
+                touch_disk_cache(last)
+            else:
+                last.update(meta, df=df)
+                write_disk_cache(last)
+        return df
+
+    except Exception as e:
+        st.error(f"❌ Error fetching data: {e}")
+        return None
+
+
+def force_refresh():
+    fetch_farside_flows.clear()
+    CACHE_PATH.unlink(missing_ok=True)
@@ -1,20 +1,18 @@
 import streamlit as st
-from crypto_etf_flows import fetch_etf_flows
+from fetchers import fetch_farside_flows, force_refresh
 
 st.set_page_config(page_title="Crypto ETF Flows Dashboard", layout="wide")
 
 st.title("📊 Crypto ETF Flows Dashboard (BlackRock, Grayscale, Fidelity, …)")
-st.caption("Live flows parsed from Farside using BeautifulSoup.")
+st.caption("Live flows parsed from Farside via r.jina.ai.")
 
 # Refresh button
 if st.button("🔄 Force refresh (clear cache)"):
-    st.cache_data.clear()
+    force_refresh()
     st.rerun()
 
-# Fetch ETF data
-try:
-    df = fetch_etf_flows()
+# Fetch ETF data (errors are reported by the fetcher, which returns None)
+df = fetch_farside_flows()
+if df is not None:
     st.success("✅ Data fetched successfully!")
     st.dataframe(df, use_container_width=True)
-except Exception as e:
-    st.error(f"Error fetching data: {e}")
@@ -0,0 +1,46 @@
+from fetchers import parse_markdown_table
+
+PAGE = """Title: Bitcoin ETF Flow
+Markdown Content:
+| | Blackrock | Fidelity |
+| Date | IBIT | FBTC |
+| --- | --- | --- |
+| 11 Jan 2024 | 111.7 | 227.0 |
+| 12 Jan 2024 | 386.0 | 195.3 |
+
+| Date | Notes |
+| --- | --- |
+| 15 Jan 2024 | Market closed |
+"""
+
+
+def test_stops_at_end_of_flows_table():
+    df = parse_markdown_table(PAGE)
+
+    assert list(df.columns) == ["Date", "IBIT", "FBTC"]
+    assert df["Date"].tolist() == ["11 Jan 2024", "12 Jan 2024"]
+
+
+def test_skips_separator_row():
+    df = parse_markdown_table(PAGE)
+
+    assert not df["IBIT"].str.fullmatch(r":?-+:?").any()
+
+
+def test_escaped_pipe_stays_inside_its_cell():
+    page = PAGE.replace("| 111.7 |", "| 111.7 \\| est. |")
+
+    df = parse_markdown_table(page)
+
+    assert df["Date"].tolist() == ["11 Jan 2024", "12 Jan 2024"]
+    assert df["IBIT"].tolist() == ["111.7 | est.", "386.0"]
+
+
+def test_missing_header_returns_none():
+    assert parse_markdown_table(PAGE.replace("| Date |", "| Day |")) is None
+
+
+def test_header_without_rows_returns_none():
+    page = PAGE.split("| 11 Jan 2024")[0]
+
+    assert parse_markdown_table(page) is None